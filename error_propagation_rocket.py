@@ -6,13 +6,15 @@ are the truncated vs rounded values to 4 decimal places. The script shows the va
 at the 20th, 40th, 60th, and 100th term of the series for both baselines and the gap between them.
 
 Rocket visualization: two rockets are driven by pi from Leibniz at each step (trunc vs round).
-Run with Python for table + rockets; --viz for rockets only.
+Run with Python for table + rockets; --viz for rockets only; --method machin to use Machin's
+arctan formula instead of Leibniz.
 """
 
 import argparse
+import itertools
 import math
-import time
-from typing import List, Optional
+from array import array
+from typing import Callable, Dict, List, NamedTuple, Optional
 
 # Terms at which we report (assignment: 20th, 40th, 60th, 100th)
 STEPS = [20, 40, 60, 100]
@@ -24,12 +26,37 @@ VISUAL_AMPLIFICATION = 500
 STEP_DELAY = 0.05
 STOP_AT_STEP_SEC = 0.8
 
+# Running Leibniz sums: _leibniz_cache[k] = sum of the first k + 1 terms (without the factor 4).
+# Stored as a packed double array so long --steps runs stay at 8 bytes per term.
+_leibniz_cache = array("d")
+
+# Machin approximations: _machin_cache[k] = π after k + 1 terms of each arctan series.
+# _machin_state holds [arctan(1/5) sum, arctan(1/239) sum, next 1/5 power, next 1/239 power].
+_machin_cache = array("d")
+_machin_state: List[float] = [0.0, 0.0, 1 / 5, 1 / 239]
+_MACHIN_X5_SQ = (1 / 5) ** 2
+_MACHIN_X239_SQ = (1 / 239) ** 2
+
+
+def _extend_leibniz(n_terms: int) -> None:
+    """Extend the cached partial sums so that at least n_terms of them are available."""
+    start = len(_leibniz_cache)
+    if n_terms <= start:
+        return
+    total = _leibniz_cache[-1] if _leibniz_cache else 0.0
+    # Alternate the sign on the parity of k instead of evaluating (-1) ** k
+    terms = ((-1.0 if k & 1 else 1.0) / (2 * k + 1) for k in range(start, n_terms))
+    sums = itertools.accumulate(itertools.chain([total], terms))
+    next(sums)
+    _leibniz_cache.extend(sums)
+
 
 def compute_pi_leibniz(n_terms: int) -> float:
     """
     Compute π using the Leibniz/Gregory series: π/4 = 1 - 1/3 + 1/5 - 1/7 + ...
 
-    This is a formula that CALCULATES π (as required by the assignment).
+    This is a formula that CALCULATES π (as required by the assignment). Partial sums are
+    cached, so successive calls only sum the terms not seen before.
 
     Args:
         n_terms: Number of terms to sum.
@@ -39,10 +66,97 @@ def compute_pi_leibniz(n_terms: int) -> float:
     """
     if n_terms <= 0:
         raise ValueError(f"n_terms must be positive, got {n_terms}")
-    total = 0.0
-    for k in range(n_terms):
-        total += (-1) ** k / (2 * k + 1)
-    return 4.0 * total
+    _extend_leibniz(n_terms)
+    return 4.0 * _leibniz_cache[n_terms - 1]
+
+
+def leibniz_partials(n_terms: int) -> List[float]:
+    """Return the Leibniz π approximations after 1, 2, ..., n_terms terms, computed in one pass."""
+    if n_terms <= 0:
+        raise ValueError(f"n_terms must be positive, got {n_terms}")
+    _extend_leibniz(n_terms)
+    return [4.0 * total for total in _leibniz_cache[:n_terms]]
+
+
+def _extend_machin(n_terms: int) -> None:
+    """Extend the cached Machin approximations so that at least n_terms of them are available."""
+    start = len(_machin_cache)
+    if n_terms <= start:
+        return
+    atan_5, atan_239, power_5, power_239 = _machin_state
+    # arctan(x) = x - x^3/3 + x^5/5 - ...; power_* holds x^(2k+1) for the next term
+    for k in range(start, n_terms):
+        if k & 1:
+            atan_5 -= power_5 / (2 * k + 1)
+            atan_239 -= power_239 / (2 * k + 1)
+        else:
+            atan_5 += power_5 / (2 * k + 1)
+            atan_239 += power_239 / (2 * k + 1)
+        power_5 *= _MACHIN_X5_SQ
+        power_239 *= _MACHIN_X239_SQ
+        _machin_cache.append(16.0 * atan_5 - 4.0 * atan_239)
+    _machin_state[:] = [atan_5, atan_239, power_5, power_239]
+
+
+def compute_pi_machin(n_terms: int) -> float:
+    """
+    Compute π using Machin's formula: π = 16·arctan(1/5) - 4·arctan(1/239).
+
+    Each arctan series converges geometrically, so about 10 terms already reach double precision
+    (Leibniz would need ~10^15 terms for the same accuracy). Like Leibniz, the approximations are
+    cached and extended incrementally.
+
+    Args:
+        n_terms: Number of terms to sum in each arctan series.
+
+    Returns:
+        Approximation of π after n_terms.
+    """
+    if n_terms <= 0:
+        raise ValueError(f"n_terms must be positive, got {n_terms}")
+    _extend_machin(n_terms)
+    return _machin_cache[n_terms - 1]
+
+
+def machin_partials(n_terms: int) -> List[float]:
+    """Return the Machin π approximations after 1, 2, ..., n_terms terms, computed in one pass."""
+    if n_terms <= 0:
+        raise ValueError(f"n_terms must be positive, got {n_terms}")
+    _extend_machin(n_terms)
+    return _machin_cache[:n_terms].tolist()
+
+
+class PiMethod(NamedTuple):
+    """A formula that calculates π: display name, printed formula and its compute functions."""
+
+    name: str
+    formula: str
+    compute: Callable[[int], float]
+    partials: Callable[[int], List[float]]
+
+
+# Formulas that calculate π, selectable with --method
+PI_METHODS: Dict[str, PiMethod] = {
+    "leibniz": PiMethod(
+        "Leibniz", "pi/4 = 1 - 1/3 + 1/5 - 1/7 + ... (Leibniz)", compute_pi_leibniz, leibniz_partials
+    ),
+    "machin": PiMethod(
+        "Machin", "pi = 16*arctan(1/5) - 4*arctan(1/239) (Machin)", compute_pi_machin, machin_partials
+    ),
+}
+
+
+def get_pi_method(method: str) -> PiMethod:
+    """Look up a π formula by its --method key."""
+    try:
+        return PI_METHODS[method]
+    except KeyError:
+        raise ValueError(f"unknown method {method!r}; expected one of {sorted(PI_METHODS)}") from None
+
+
+def pi_partials(n_terms: int, method: str = "leibniz") -> List[float]:
+    """Return the π approximations after 1, 2, ..., n_terms terms of the chosen method."""
+    return get_pi_method(method).partials(n_terms)
 
 
 def truncate_to_n_decimals(value: float, n: int) -> float:
@@ -61,15 +175,55 @@ def rocket_vector_magnitude(pi_value: float, step: int) -> float:
     return math.sqrt((pi_value * step) ** 2 + step**2)
 
 
+def rocket_schedule(max_step: int = MAX_STEP, method: str = "leibniz") -> Dict[str, list]:
+    """
+    Compute every per-step value the rocket animation needs for steps 1..max_step.
+
+    Returns a dict of parallel lists (index i holds step i + 1): vec_trunc, vec_round, vec_gap,
+    positions_trunc and positions_round. All lists are empty when max_step is not positive.
+    """
+    partials = pi_partials(max_step, method) if max_step > 0 else []
+    pi_truncs = [truncate_to_n_decimals(partial, DECIMAL_PLACES) for partial in partials]
+    pi_rounds = [round_to_n_decimals(partial, DECIMAL_PLACES) for partial in partials]
+    vecs_trunc = [rocket_vector_magnitude(pi_trunc, s) for s, pi_trunc in enumerate(pi_truncs, start=1)]
+    vecs_round = [rocket_vector_magnitude(pi_round, s) for s, pi_round in enumerate(pi_rounds, start=1)]
+    vec_gaps = [abs(vec_round - vec_trunc) for vec_trunc, vec_round in zip(vecs_trunc, vecs_round)]
+    angles_trunc = [pi_trunc * s / ANGLE_DIVISOR for s, pi_trunc in enumerate(pi_truncs, start=1)]
+    angles_round_visual = [
+        angle_trunc + (pi_round * s / ANGLE_DIVISOR - angle_trunc) * VISUAL_AMPLIFICATION
+        for s, (angle_trunc, pi_round) in enumerate(zip(angles_trunc, pi_rounds), start=1)
+    ]
+
+    # Both rockets sit at the same radius for a given step, so compute the radii once
+    radii = [s * SCALE for s in range(1, len(partials) + 1)]
+    _cos = math.cos
+    _sin = math.sin
+    positions_trunc = [(r * _cos(angle), r * _sin(angle)) for r, angle in zip(radii, angles_trunc)]
+    positions_round = [(r * _cos(angle), r * _sin(angle)) for r, angle in zip(radii, angles_round_visual)]
+
+    return {
+        "vec_trunc": vecs_trunc,
+        "vec_round": vecs_round,
+        "vec_gap": vec_gaps,
+        "positions_trunc": positions_trunc,
+        "positions_round": positions_round,
+    }
+
+
 def print_comparison_table(
     steps_highlight: Optional[List[int]] = None,
     precision: int = 15,
+    method: str = "leibniz",
 ) -> None:
     """
-    Print the assignment table: at the 20th, 40th, 60th, 100th term of the Leibniz series,
-    show partial π, truncated (4 dec), rounded (4 dec), and the gap between the two baselines.
+    Print the assignment table: at the 20th, 40th, 60th, 100th term of the Leibniz series
+    (or the series chosen by method), show partial π, truncated (4 dec), rounded (4 dec),
+    and the gap between the two baselines.
     """
     steps = steps_highlight if steps_highlight is not None else STEPS
+    pi_method = get_pi_method(method)
+    compute_pi = pi_method.compute
+    method_name = pi_method.name
     n_dec = DECIMAL_PLACES
     col_term = "Term"
     col_partial = "Partial pi"
@@ -81,8 +235,8 @@ def print_comparison_table(
     w_val = max(20, precision + 6)
     w_gap = max(14, precision)
 
-    print("\n--- Error Propagation: pi from Leibniz Series (Truncated vs Rounded Baseline) ---")
-    print("Formula that calculates pi: pi/4 = 1 - 1/3 + 1/5 - 1/7 + ... (Leibniz)")
+    print(f"\n--- Error Propagation: pi from {method_name} Series (Truncated vs Rounded Baseline) ---")
+    print(f"Formula that calculates pi: {pi_method.formula}")
     print("Baselines: 3.1415 (truncate to 4 dec) and 3.1416 (round to 4 dec).")
     print("Table shows the 20th, 40th, 60th, 100th term: partial pi and the gap between the two baselines.\n")
 
@@ -91,15 +245,19 @@ def print_comparison_table(
     print(header)
     print(separator)
 
+    rows = []
     for term in sorted(steps):
-        partial = compute_pi_leibniz(term)
+        partial = compute_pi(term)
         trunc_val = truncate_to_n_decimals(partial, n_dec)
         round_val = round_to_n_decimals(partial, n_dec)
         gap = abs(round_val - trunc_val)
-        print(
+        rows.append(
             f"{term:<{w_term}} | {partial:<{w_val}.{precision}f} | {trunc_val:<{w_val}.{n_dec}f} | "
             f"{round_val:<{w_val}.{n_dec}f} | {gap:<{w_gap}.{precision}f}"
         )
+    # Emit all rows with a single write
+    if rows:
+        print("\n".join(rows))
 
     print(separator)
     print()
@@ -108,10 +266,12 @@ def print_comparison_table(
 def run_rocket_visualization(
     steps_highlight: Optional[List[int]] = None,
     max_step: int = MAX_STEP,
+    method: str = "leibniz",
 ) -> None:
     """
-    Rocket visualization driven by Leibniz: at each step n, pi comes from the nth term
-    (truncated vs rounded to 4 decimals). Green rocket = trunc baseline, cyan = round baseline.
+    Rocket visualization driven by Leibniz (or the series chosen by method): at each step n,
+    pi comes from the nth term (truncated vs rounded to 4 decimals).
+    Green rocket = trunc baseline, cyan = round baseline.
     """
     try:
         import turtle
@@ -119,20 +279,15 @@ def run_rocket_visualization(
         print("Turtle not available; run with --table-only to see the table.")
         return
 
-    steps = steps_highlight if steps_highlight is not None else STEPS
+    steps_set = frozenset(steps_highlight if steps_highlight is not None else STEPS)
+    method_name = get_pi_method(method).name
     screen = turtle.Screen()
     screen.setup(900, 700)
     screen.bgcolor("#0a0a0f")
-    screen.title("Rocket - pi from Leibniz (Trunc vs Round)")
+    screen.title(f"Rocket - pi from {method_name} (Trunc vs Round)")
     screen.setworldcoordinates(-380, -380, 380, 380)
     turtle.tracer(0)
 
-    def position_from_angle(angle_rad: float, s: int) -> tuple:
-        radius = s * SCALE
-        x = radius * math.cos(angle_rad)
-        y = radius * math.sin(angle_rad)
-        return (x, y)
-
     t1 = turtle.Turtle()
     t1.shape("triangle")
     t1.shapesize(1.0, 1.4)
@@ -167,67 +322,79 @@ def run_rocket_visualization(
     value_line.color("#00ff88")
     value_line.goto(0, 190)
 
-    start0 = position_from_angle(0.0, 0)
+    start0 = (0.0, 0.0)
     t1.goto(start0)
     t2.goto(start0)
     t1.pendown()
     t2.pendown()
 
-    for step in range(1, max_step + 1):
-        # Pi at this step from Leibniz (trunc vs round to 4 dec) — rockets connected to Leibniz
-        partial = compute_pi_leibniz(step)
-        pi_trunc = truncate_to_n_decimals(partial, DECIMAL_PLACES)
-        pi_round = round_to_n_decimals(partial, DECIMAL_PLACES)
-
-        angle_trunc = pi_trunc * step / ANGLE_DIVISOR
-        angle_round_true = pi_round * step / ANGLE_DIVISOR
-        angle_round_visual = angle_trunc + (angle_round_true - angle_trunc) * VISUAL_AMPLIFICATION
-
-        pos_trunc = position_from_angle(angle_trunc, step)
-        pos_round = position_from_angle(angle_round_visual, step)
-
-        t1.goto(pos_trunc)
-        t2.goto(pos_round)
-
-        turtle.update()
-        time.sleep(STEP_DELAY)
-
-        if step in steps:
-            vec_trunc = rocket_vector_magnitude(pi_trunc, step)
-            vec_round = rocket_vector_magnitude(pi_round, step)
-            gap = abs(vec_round - vec_trunc)
+    # Precompute the whole schedule up front so the animation loop only drives the turtles
+    schedule = rocket_schedule(max_step, method)
+    positions_trunc = schedule["positions_trunc"]
+    positions_round = schedule["positions_round"]
+    vecs_trunc = schedule["vec_trunc"]
+    vecs_round = schedule["vec_round"]
+    vec_gaps = schedule["vec_gap"]
+
+    # Bind per-frame callables to locals to skip repeated attribute lookups
+    t1_goto = t1.goto
+    t2_goto = t2.goto
+    _update = turtle.update
+    _ontimer = screen.ontimer
+
+    def finish() -> None:
+        t1.penup()
+        t2.penup()
+
+        label1 = turtle.Turtle()
+        label1.hideturtle()
+        label1.penup()
+        label1.color("#00ff88")
+        label1.goto(t1.xcor() - 12, t1.ycor())
+        label1.write(f"Trunc ({method_name})", align="right", font=("Arial", 14, "bold"))
+        label2 = turtle.Turtle()
+        label2.hideturtle()
+        label2.penup()
+        label2.color("#00ccff")
+        label2.goto(t2.xcor() - 12, t2.ycor())
+        label2.write(f"Round ({method_name})", align="right", font=("Arial", 14, "bold"))
+
+        turtle.tracer(1)
+        # Only allow click-to-close once the animation has finished
+        screen.onclick(lambda *_: screen.bye())
+
+    def tick(step: int = 1) -> None:
+        # One animation frame; the next one is scheduled on the Tk event loop instead of sleeping
+        if step > max_step:
+            finish()
+            return
+        i = step - 1
+        t1_goto(positions_trunc[i])
+        t2_goto(positions_round[i])
+        _update()
+
+        delay = STEP_DELAY
+        if step in steps_set:
+            vec_trunc = vecs_trunc[i]
+            vec_round = vecs_round[i]
+            gap = vec_gaps[i]
             value_line.clear()
             value_line.write(
                 f"{int(step):>4}   —   {vec_trunc:>18.10f}   —   {vec_round:>18.10f}   —   {gap:>18.10f}",
                 align="center",
                 font=("Consolas", 14, "normal"),
             )
-            turtle.update()
-            time.sleep(STOP_AT_STEP_SEC)
+            _update()
+            delay += STOP_AT_STEP_SEC
+        _ontimer(lambda: tick(step + 1), int(delay * 1000))
 
-    t1.penup()
-    t2.penup()
-
-    label1 = turtle.Turtle()
-    label1.hideturtle()
-    label1.penup()
-    label1.color("#00ff88")
-    label1.goto(t1.xcor() - 12, t1.ycor())
-    label1.write("Trunc (Leibniz)", align="right", font=("Arial", 14, "bold"))
-    label2 = turtle.Turtle()
-    label2.hideturtle()
-    label2.penup()
-    label2.color("#00ccff")
-    label2.goto(t2.xcor() - 12, t2.ycor())
-    label2.write("Round (Leibniz)", align="right", font=("Arial", 14, "bold"))
-
-    turtle.tracer(1)
-    turtle.exitonclick()
+    _ontimer(tick, 0)
+    turtle.mainloop()
 
 
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
-        description="Computational lab: π from Leibniz series; compare trunc vs round baseline at 20, 40, 60, 100.",
+        description="Computational lab: π from a series (Leibniz or Machin); compare trunc vs round baseline at 20, 40, 60, 100.",
     )
     parser.add_argument(
         "--table-only",
@@ -237,7 +404,7 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--viz",
         action="store_true",
-        help="Show rocket visualization (pi from Leibniz at each step; trunc vs round).",
+        help="Show rocket visualization (pi from the chosen --method at each step; trunc vs round).",
     )
     parser.add_argument(
         "--steps",
@@ -247,6 +414,12 @@ def _parse_args() -> argparse.Namespace:
         metavar="N",
         help="Terms to report (default: 20 40 60 100).",
     )
+    parser.add_argument(
+        "--method",
+        choices=sorted(PI_METHODS),
+        default="leibniz",
+        help="Formula that calculates pi (default: leibniz).",
+    )
     args = parser.parse_args()
     return args
 
@@ -254,15 +427,16 @@ def _parse_args() -> argparse.Namespace:
 def main() -> None:
     args = _parse_args()
     steps = args.steps
+    method = args.method
 
     if not args.viz:
-        print_comparison_table(steps_highlight=steps)
+        print_comparison_table(steps_highlight=steps, method=method)
 
     if args.viz or not args.table_only:
         if not args.table_only and not args.viz:
-            run_rocket_visualization(steps_highlight=steps)
+            run_rocket_visualization(steps_highlight=steps, method=method)
         elif args.viz:
-            run_rocket_visualization(steps_highlight=steps)
+            run_rocket_visualization(steps_highlight=steps, method=method)
 
     if not args.table_only and not args.viz:
         input("\nPress Enter to exit...")
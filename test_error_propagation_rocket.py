@@ -0,0 +1,116 @@
+"""Checks for the π formulas and the comparison table. Run with: python -m unittest"""
+
+import contextlib
+import io
+import math
+import unittest
+from unittest import mock
+
+import error_propagation_rocket as epr
+
+
+def _run_main(*argv: str) -> str:
+    out = io.StringIO()
+    with mock.patch("sys.argv", ["error_propagation_rocket.py", *argv]), contextlib.redirect_stdout(out):
+        epr.main()
+    return out.getvalue()
+
+
+def _leibniz_direct(n_terms: int) -> float:
+    return 4.0 * sum((-1) ** k / (2 * k + 1) for k in range(n_terms))
+
+
+class LeibnizCacheTest(unittest.TestCase):
+    def test_out_of_order_calls_match_direct_sum(self):
+        for n_terms in (100, 50, 1000, 1, 999):
+            self.assertEqual(epr.compute_pi_leibniz(n_terms), _leibniz_direct(n_terms))
+
+    def test_partials_match_single_calls(self):
+        partials = epr.leibniz_partials(250)
+        self.assertEqual(partials, [epr.compute_pi_leibniz(n) for n in range(1, 251)])
+
+    def test_rejects_non_positive_terms(self):
+        with self.assertRaises(ValueError):
+            epr.compute_pi_leibniz(0)
+
+
+class MachinTest(unittest.TestCase):
+    def test_reaches_math_pi(self):
+        self.assertAlmostEqual(epr.compute_pi_machin(20), math.pi, places=14)
+
+    def test_partials_match_single_calls(self):
+        partials = epr.pi_partials(30, "machin")
+        self.assertEqual(partials, [epr.compute_pi_machin(n) for n in range(1, 31)])
+
+    def test_rejects_non_positive_terms(self):
+        with self.assertRaises(ValueError):
+            epr.compute_pi_machin(0)
+
+    def test_unknown_method_rejected(self):
+        with self.assertRaises(ValueError):
+            epr.pi_partials(3, "levin")
+        with self.assertRaises(ValueError):
+            epr.rocket_schedule(3, "levin")
+        with self.assertRaises(ValueError), contextlib.redirect_stdout(io.StringIO()):
+            epr.print_comparison_table([3], method="levin")
+
+    def test_method_flag_selects_machin(self):
+        output = _run_main("--table-only", "--method", "machin", "--steps", "20")
+        self.assertIn("pi from Machin Series", output)
+        self.assertIn(f"{math.pi:.14f}", output)
+
+
+def _baseline_frame(step: int):
+    """One rocket frame computed the way the original per-step animation loop did."""
+    partial = _leibniz_direct(step)
+    pi_trunc = epr.truncate_to_n_decimals(partial, epr.DECIMAL_PLACES)
+    pi_round = epr.round_to_n_decimals(partial, epr.DECIMAL_PLACES)
+    angle_trunc = pi_trunc * step / epr.ANGLE_DIVISOR
+    angle_round_true = pi_round * step / epr.ANGLE_DIVISOR
+    angle_round_visual = angle_trunc + (angle_round_true - angle_trunc) * epr.VISUAL_AMPLIFICATION
+    radius = step * epr.SCALE
+    pos_trunc = (radius * math.cos(angle_trunc), radius * math.sin(angle_trunc))
+    pos_round = (radius * math.cos(angle_round_visual), radius * math.sin(angle_round_visual))
+    gap = abs(epr.rocket_vector_magnitude(pi_round, step) - epr.rocket_vector_magnitude(pi_trunc, step))
+    return pos_trunc, pos_round, gap
+
+
+class RocketScheduleTest(unittest.TestCase):
+    def test_matches_per_step_computation(self):
+        schedule = epr.rocket_schedule(100)
+        for step in (1, 20, 40, 77, 100):
+            pos_trunc, pos_round, gap = _baseline_frame(step)
+            self.assertEqual(schedule["positions_trunc"][step - 1], pos_trunc)
+            self.assertEqual(schedule["positions_round"][step - 1], pos_round)
+            self.assertEqual(schedule["vec_gap"][step - 1], gap)
+
+    def test_zero_steps_gives_empty_schedule(self):
+        schedule = epr.rocket_schedule(0)
+        self.assertTrue(schedule)
+        self.assertFalse(any(schedule.values()))
+
+
+class LeibnizTableTest(unittest.TestCase):
+    def test_default_table_unchanged(self):
+        output = _run_main("--table-only")
+        self.assertIn("pi from Leibniz Series", output)
+        rows = [line.split(" | ") for line in output.splitlines() if line[:1].isdigit()]
+        self.assertEqual(
+            [[cell.strip() for cell in row] for row in rows],
+            [
+                ["20", "3.091623806667840", "3.0916", "3.0916", "0.000000000000000"],
+                ["40", "3.116596556793833", "3.1165", "3.1166", "0.000100000000000"],
+                ["60", "3.124927143928997", "3.1249", "3.1249", "0.000000000000000"],
+                ["100", "3.131592903558554", "3.1315", "3.1316", "0.000100000000000"],
+            ],
+        )
+
+    def test_empty_steps_print_empty_table(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            epr.print_comparison_table([])
+        self.assertFalse([line for line in out.getvalue().splitlines() if line[:1].isdigit()])
+
+
+if __name__ == "__main__":
+    unittest.main()